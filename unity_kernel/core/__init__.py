@@ -6,7 +6,8 @@ All core kernel components.
 
 from .types import (
     Event, EventType, Priority, SystemState, ModuleState,
-    QueueItem, ModuleInfo, SystemMetrics, HealthCheck
+    QueueItem, ModuleInfo, SystemMetrics, HealthCheck,
+    format_timestamp_ns
 )
 from .event_bus import AsyncEventBus
 from .priority_queue import AsyncPriorityProcessor
@@ -14,6 +15,7 @@ from .config import ConfigManager
 from .base_module import BaseModule
 from .module_loader import ModuleLoader
 from .health_monitor import HealthMonitor
+from .profiler import AsyncProfiler, profiler
 
 __all__ = [
     # Types
@@ -26,6 +28,7 @@ __all__ = [
     'ModuleInfo',
     'SystemMetrics',
     'HealthCheck',
+    'format_timestamp_ns',
 
     # Core components
     'AsyncEventBus',
@@ -34,4 +37,6 @@ __all__ = [
     'BaseModule',
     'ModuleLoader',
     'HealthMonitor',
+    'AsyncProfiler',
+    'profiler',
 ]
@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from .types import Event, ModuleInfo, ModuleState, HealthCheck, Priority
+from .profiler import profiler
 
 
 class BaseModule(ABC):
@@ -97,19 +98,41 @@ class BaseModule(ABC):
 
         print(f"✓ Module stopped: {self.info.name}")
 
-    async def publish(self, event: Event, persist: bool = True) -> None:
+    async def publish(self, event: Event, persist: bool = True,
+                      persist_local: bool = True, confirm: any = 'auto') -> None:
         """
         Publish an event to the bus
 
         Args:
             event: Event to publish
             persist: Whether to persist to Redis Streams
+            persist_local: Persist even when only in-process subscribers consume it
+            confirm: Wait for the stream write ('auto' = unless priority is LOW or below)
         """
         # Set source if not already set
         if not event.source:
             event.source = self.info.name
 
-        await self.event_bus.publish(event, persist=persist)
+        await self.event_bus.publish(event, persist=persist, persist_local=persist_local,
+                                     confirm=confirm)
+
+    async def publish_many(self, events: List[Event], persist: bool = True,
+                           persist_local: bool = True, confirm: any = 'auto') -> None:
+        """
+        Publish a batch of events to the bus (single pipelined persist)
+
+        Args:
+            events: Events to publish
+            persist: Whether to persist to Redis Streams
+            persist_local: Persist even when only in-process subscribers consume them
+            confirm: Wait for the stream write ('auto' = unless priority is LOW or below)
+        """
+        for event in events:
+            if not event.source:
+                event.source = self.info.name
+
+        await self.event_bus.publish_many(events, persist=persist, persist_local=persist_local,
+                                          confirm=confirm)
 
     def subscribe(self, event_pattern: str, handler: Callable) -> None:
         """
@@ -126,12 +149,18 @@ class BaseModule(ABC):
         """
         Create a tracked background task
 
+        When kernel.profile_async is enabled, the task's loop time is
+        recorded under "<module>:<coroutine>".
+
         Args:
             coro: Coroutine to run as task
 
         Returns:
             Created task
         """
+        if profiler.enabled:
+            coro = profiler.track(coro, f"{self.info.name}:{coro.__qualname__}")
+
         task = asyncio.create_task(coro)
         self._tasks.append(task)
         return task
@@ -153,7 +182,6 @@ class BaseModule(ABC):
         return HealthCheck(
             component=self.info.name,
             status=status,
-            timestamp=self._last_health_check,
             metrics={
                 'state': self.state.value,
                 'tasks_running': len([t for t in self._tasks if not t.done()]),
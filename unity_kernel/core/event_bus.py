@@ -10,9 +10,10 @@ The core message bus that connects everything.
 
 import asyncio
 import re
-from typing import Dict, List, Callable, Optional, Pattern, Set
+import sys
+from typing import AsyncIterator, Dict, List, Callable, Optional, Pattern, Tuple
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 
 try:
@@ -21,7 +22,45 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .types import Event, Priority
+from .profiler import profiler
+
+
+# orjson is several times faster than stdlib json for stream payloads
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Naive datetimes in event data are kernel UTC timestamps (datetime.utcnow());
+# non-str dict keys are stringified like stdlib json does
+_ORJSON_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+) if ORJSON_AVAILABLE else 0
+
+# Subscribed handler paired with whether it is a coroutine function
+HandlerEntry = Tuple[Callable, bool]
+PatternEntry = Tuple[Pattern, List[HandlerEntry]]
+
+
+class _PatternNode:
+    """
+    Token trie node for wildcard subscriptions
+
+    Patterns are stored under their literal leading tokens ("sensor.camera"
+    in "sensor.camera.*"). From the first token containing '*':
+    - a bare trailing '*' matches any remaining tokens (no regex needed)
+    - anything else ("cam*", "*.raw") is checked with the pattern's regex
+    """
+    __slots__ = ('children', 'match_rest', 'match_regex')
+
+    def __init__(self):
+        self.children: Dict[str, '_PatternNode'] = {}
+        self.match_rest: List[PatternEntry] = []
+        self.match_regex: List[PatternEntry] = []
 
 
 class AsyncEventBus:
@@ -44,9 +83,12 @@ class AsyncEventBus:
             redis_url: Redis connection URL (optional)
             enable_streams: Whether to enable Redis Streams persistence
         """
-        # In-memory subscriptions: {pattern: [handlers]}
-        self._subscriptions: Dict[Pattern, List[Callable]] = {}
-        self._exact_subscriptions: Dict[str, List[Callable]] = defaultdict(list)
+        # In-memory subscriptions: {wildcard pattern: (compiled regex, [(handler, is_coro)])}
+        self._subscriptions: Dict[str, Tuple[Pattern, List[HandlerEntry]]] = {}
+        # Same entries indexed in a token trie so a publish walks only the
+        # branches matching the event type's leading tokens
+        self._pattern_trie = _PatternNode()
+        self._exact_subscriptions: Dict[str, List[HandlerEntry]] = defaultdict(list)
 
         # Redis Streams (for persistence and replay)
         self.redis_url = redis_url
@@ -54,10 +96,18 @@ class AsyncEventBus:
         self.redis_client: Optional[any] = None
         self.redis_connected = False
 
+        # Unconfirmed persistence (LOW/DEFERRED events): XADDs are queued and
+        # written by a background task in pipelined batches (size or time)
+        self.persist_batch_size = 256
+        self.persist_flush_interval = 0.05
+        self._persist_queue: Optional[asyncio.Queue] = None  # Created in start()
+        self._persist_task: Optional[asyncio.Task] = None
+
         # Statistics
         self.events_published = 0
         self.events_delivered = 0
         self.events_failed = 0
+        self._active_subs = 0
 
         # Dead letter queue (events that couldn't be delivered)
         self.dead_letter_queue: List[Event] = []
@@ -69,6 +119,9 @@ class AsyncEventBus:
         """Start the event bus"""
         self.running = True
 
+        # Built on the running loop (Python 3.9 binds queues at construction)
+        self._persist_queue = asyncio.Queue(maxsize=10000)
+
         # Connect to Redis if configured
         if self.enable_streams and self.redis_url:
             try:
@@ -79,6 +132,7 @@ class AsyncEventBus:
                 )
                 await self.redis_client.ping()
                 self.redis_connected = True
+                self._persist_task = asyncio.create_task(self._persist_writer())
                 print(f"✓ Redis Streams connected: {self.redis_url}")
             except Exception as e:
                 print(f"⚠ Redis Streams unavailable (continuing without): {e}")
@@ -88,72 +142,218 @@ class AsyncEventBus:
         """Stop the event bus"""
         self.running = False
 
+        # Drain queued unconfirmed writes before closing the connection
+        if self._persist_task:
+            await self._persist_queue.put(None)
+            await self._persist_task
+            self._persist_task = None
+
         if self.redis_client:
             await self.redis_client.close()
             self.redis_connected = False
 
-    async def publish(self, event: Event, persist: bool = True) -> None:
+    async def publish(self, event: Event, persist: bool = True,
+                      persist_local: bool = True, confirm: any = 'auto') -> None:
         """
         Publish an event to all subscribers
 
         Args:
             event: Event to publish
             persist: Whether to persist to Redis Streams
+            persist_local: Also persist when in-process subscribers consume it;
+                False skips the stream round-trip for purely local traffic
+            confirm: Wait for the XADD reply (True), queue it for the background
+                writer (False), or 'auto' = wait unless priority is LOW or below
         """
         if not self.running:
             raise RuntimeError("Event bus not running")
 
         self.events_published += 1
 
+        handlers = self._match_handlers(event.event_type)
+
         # Persist to Redis Streams first (so even if handlers fail, it's saved)
-        if persist and self.redis_connected:
-            await self._persist_to_stream(event)
+        if persist and self.redis_connected and (persist_local or not handlers):
+            if self._needs_confirm(event, confirm):
+                await self._persist_to_stream(event)
+            else:
+                await self._enqueue_persist(event)
 
         # Deliver to in-memory subscribers
-        await self._deliver_to_subscribers(event)
+        self._dispatch(handlers, event)
+
+    async def publish_many(self, events: List[Event], persist: bool = True,
+                           persist_local: bool = True, confirm: any = 'auto') -> None:
+        """
+        Publish a batch of events
+
+        Persistence uses a single Redis pipeline for the whole batch
+        (one round-trip instead of one XADD round-trip per event).
+
+        Args:
+            events: Events to publish, in order
+            persist: Whether to persist to Redis Streams
+            persist_local: Also persist events that in-process subscribers consume
+            confirm: Same as publish(); unconfirmed events go to the background writer
+        """
+        if not self.running:
+            raise RuntimeError("Event bus not running")
+
+        self.events_published += len(events)
+
+        matched = [(event, self._match_handlers(event.event_type)) for event in events]
+
+        if persist and self.redis_connected:
+            to_persist = []
+            for event, handlers in matched:
+                if not persist_local and handlers:
+                    continue
+                if self._needs_confirm(event, confirm):
+                    to_persist.append(event)
+                else:
+                    await self._enqueue_persist(event)
+            if to_persist:
+                await self._persist_many(to_persist)
+
+        for event, handlers in matched:
+            self._dispatch(handlers, event)
+
+    def _stream_entry(self, event: Event) -> Tuple[str, Dict[str, str]]:
+        """Build the Redis Stream key and fields for an event"""
+        stream_key = f"unity:events:{event.event_type}"
+        event_data = {
+            'event_id': event.event_id,
+            'event_type': event.event_type,
+            'source': event.source,
+            'destination': event.destination or '',
+            'data': _json_dumps(event.data),
+            'metadata': _json_dumps(event.enriched_metadata()),
+            'timestamp': str(event.timestamp_ns),
+            'priority': event.priority.name,
+            'correlation_id': event.correlation_id or '',
+            'parent_id': event.parent_id or ''
+        }
+        return stream_key, event_data
 
     async def _persist_to_stream(self, event: Event) -> None:
         """Persist event to Redis Stream"""
         try:
-            stream_key = f"unity:events:{event.event_type}"
-            event_data = {
-                'event_id': event.event_id,
-                'event_type': event.event_type,
-                'source': event.source,
-                'destination': event.destination or '',
-                'data': json.dumps(event.data),
-                'metadata': json.dumps(event.metadata),
-                'timestamp': event.timestamp.isoformat(),
-                'priority': event.priority.name,
-                'correlation_id': event.correlation_id or '',
-                'parent_id': event.parent_id or ''
-            }
-
+            stream_key, event_data = self._stream_entry(event)
             await self.redis_client.xadd(stream_key, event_data, maxlen=10000)
         except Exception as e:
             print(f"⚠ Failed to persist event to Redis Stream: {e}")
 
-    async def _deliver_to_subscribers(self, event: Event) -> None:
-        """Deliver event to all matching subscribers"""
-        handlers_to_call: Set[Callable] = set()
+    async def _persist_many(self, events: List[Event]) -> None:
+        """Persist a batch of events to Redis Streams in one pipeline"""
+        # Serialize each event on its own so one bad payload doesn't sink the batch
+        entries = []
+        for event in events:
+            try:
+                entries.append(self._stream_entry(event))
+            except Exception as e:
+                print(f"⚠ Failed to serialize event {event.event_id} ({event.event_type}): {e}")
 
-        # Exact match subscribers
-        if event.event_type in self._exact_subscriptions:
-            handlers_to_call.update(self._exact_subscriptions[event.event_type])
+        if not entries:
+            return
 
-        # Pattern match subscribers
-        for pattern, handlers in self._subscriptions.items():
-            if pattern.match(event.event_type):
-                handlers_to_call.update(handlers)
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for stream_key, event_data in entries:
+                    pipe.xadd(stream_key, event_data, maxlen=10000)
+                results = await pipe.execute(raise_on_error=False)
+
+            failed = sum(1 for result in results if isinstance(result, Exception))
+            if failed:
+                print(f"⚠ Failed to persist {failed}/{len(entries)} events to Redis Stream")
+        except Exception as e:
+            print(f"⚠ Failed to persist events to Redis Stream: {e}")
+
+    @staticmethod
+    def _needs_confirm(event: Event, confirm: any) -> bool:
+        """Whether a publish should wait for its XADD reply"""
+        if confirm == 'auto':
+            return event.priority.value < Priority.LOW.value
+        return bool(confirm)
+
+    async def _enqueue_persist(self, event: Event) -> None:
+        """Queue an unconfirmed XADD (falls back to a direct write when full)"""
+        if self._persist_task is None:
+            await self._persist_to_stream(event)
+            return
+
+        try:
+            self._persist_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Backpressure: write through rather than drop
+            await self._persist_to_stream(event)
 
-        # Call all handlers (don't wait for them)
-        for handler in handlers_to_call:
-            asyncio.create_task(self._safe_call_handler(handler, event))
+    async def _persist_writer(self) -> None:
+        """Background task: flush queued XADDs in pipelined batches"""
+        queue = self._persist_queue
+        stopping = False
+
+        while not stopping:
+            event = await queue.get()
+            if event is None:
+                break
+            batch = [event]
+
+            # Collect up to persist_batch_size, waiting at most one flush interval
+            for attempt in range(2):
+                while len(batch) < self.persist_batch_size and not queue.empty():
+                    event = queue.get_nowait()
+                    if event is None:
+                        stopping = True
+                        break
+                    batch.append(event)
+                if stopping or len(batch) >= self.persist_batch_size or attempt:
+                    break
+                await asyncio.sleep(self.persist_flush_interval)
+
+            await self._persist_many(batch)
+
+    def _match_handlers(self, event_type: str) -> Dict[HandlerEntry, None]:
+        """Collect in-process handlers subscribed to an event type"""
+        # Insertion-ordered dict dedupes handlers subscribed under several patterns
+        handlers_to_call: Dict[HandlerEntry, None] = {}
 
-    async def _safe_call_handler(self, handler: Callable, event: Event) -> None:
+        # Exact match subscribers
+        if event_type in self._exact_subscriptions:
+            handlers_to_call.update(dict.fromkeys(self._exact_subscriptions[event_type]))
+
+        # Pattern match subscribers: one trie walk over the event's tokens
+        node = self._pattern_trie
+        for token in event_type.split('.'):
+            # A trailing '*' here matches: at least one token remains
+            for pattern, handlers in node.match_rest:
+                handlers_to_call.update(dict.fromkeys(handlers))
+            for pattern, handlers in node.match_regex:
+                if pattern.match(event_type):
+                    handlers_to_call.update(dict.fromkeys(handlers))
+            node = node.children.get(token)
+            if node is None:
+                break
+        else:
+            # Consumed every token; only in-token wildcards ("a.b*") can still match
+            for pattern, handlers in node.match_regex:
+                if pattern.match(event_type):
+                    handlers_to_call.update(dict.fromkeys(handlers))
+
+        return handlers_to_call
+
+    def _dispatch(self, handlers: Dict[HandlerEntry, None], event: Event) -> None:
+        """Schedule matched handlers (don't wait for them)"""
+        for handler, is_coro in handlers:
+            coro = self._safe_call_handler(handler, is_coro, event)
+            if profiler.enabled:
+                # Attribute loop time to the handler (kernel.profile_async)
+                coro = profiler.track(coro, getattr(handler, '__qualname__', repr(handler)))
+            asyncio.create_task(coro)
+
+    async def _safe_call_handler(self, handler: Callable, is_coro: bool, event: Event) -> None:
         """Call handler with error handling"""
         try:
-            if asyncio.iscoroutinefunction(handler):
+            if is_coro:
                 await handler(event)
             else:
                 handler(event)
@@ -177,82 +377,101 @@ class AsyncEventBus:
             bus.subscribe("sensor.*", handle_all_sensors)
             bus.subscribe("*", handle_everything)
         """
-        # Exact match (most common, most efficient)
+        # Classify once here instead of on every delivery
+        handler_entry = (handler, asyncio.iscoroutinefunction(handler))
+
+        # Exact match (most common, most efficient); interned so lookups
+        # with interned event types short-circuit on identity
         if '*' not in event_pattern:
-            self._exact_subscriptions[event_pattern].append(handler)
+            self._exact_subscriptions[sys.intern(event_pattern)].append(handler_entry)
         else:
-            # Convert wildcard pattern to regex
-            regex_pattern = event_pattern.replace('.', r'\.').replace('*', '.*')
-            compiled_pattern = re.compile(f'^{regex_pattern}$')
-
-            if compiled_pattern not in self._subscriptions:
-                self._subscriptions[compiled_pattern] = []
-            self._subscriptions[compiled_pattern].append(handler)
+            entry = self._subscriptions.get(event_pattern)
+            if not entry:
+                # Convert wildcard pattern to regex (compiled once per pattern)
+                regex_pattern = event_pattern.replace('.', r'\.').replace('*', '.*')
+                entry = (re.compile(f'^{regex_pattern}$'), [])
+                self._subscriptions[event_pattern] = entry
+                self._insert_pattern(event_pattern, entry)
+            entry[1].append(handler_entry)
+
+        self._active_subs += 1
+
+    def _insert_pattern(self, event_pattern: str, entry: PatternEntry) -> None:
+        """Index a wildcard pattern in the token trie"""
+        node = self._pattern_trie
+        tokens = event_pattern.split('.')
+
+        for i, token in enumerate(tokens):
+            if '*' in token:
+                if token == '*' and i == len(tokens) - 1:
+                    node.match_rest.append(entry)
+                else:
+                    node.match_regex.append(entry)
+                return
+            node = node.children.setdefault(sys.intern(token), _PatternNode())
 
     def unsubscribe(self, event_pattern: str, handler: Callable) -> None:
         """Unsubscribe a handler from an event pattern"""
+        handler_entry = (handler, asyncio.iscoroutinefunction(handler))
+
         if '*' not in event_pattern:
             if event_pattern in self._exact_subscriptions:
-                self._exact_subscriptions[event_pattern].remove(handler)
-        else:
-            regex_pattern = event_pattern.replace('.', r'\.').replace('*', '.*')
-            compiled_pattern = re.compile(f'^{regex_pattern}$')
-
-            if compiled_pattern in self._subscriptions:
-                self._subscriptions[compiled_pattern].remove(handler)
+                self._exact_subscriptions[event_pattern].remove(handler_entry)
+                self._active_subs -= 1
+        elif event_pattern in self._subscriptions:
+            self._subscriptions[event_pattern][1].remove(handler_entry)
+            self._active_subs -= 1
 
     async def replay_stream(self, stream_key: str, from_id: str = "0",
-                           handler: Optional[Callable] = None) -> List[Event]:
+                           handler: Optional[Callable] = None,
+                           batch_size: int = 500) -> AsyncIterator[Event]:
         """
         Replay events from Redis Stream
 
         Critical for resilience: If a model crashes, it can replay missed events.
+        The stream is paged with XRANGE so memory stays bounded per batch, and
+        events are yielded as they are decoded instead of materialized up front.
 
         Args:
             stream_key: Stream to replay from
-            from_id: Start position ('0' = beginning, '$' = latest)
+            from_id: Replay entries after this ID ('0' = beginning, '$' = latest)
             handler: Optional handler to call for each event
+            batch_size: Number of stream entries fetched per XRANGE call
 
-        Returns:
-            List of replayed events
+        Yields:
+            Replayed events in stream order
         """
-        if not self.redis_connected:
-            return []
+        if not self.redis_connected or from_id == '$':
+            return
 
-        try:
-            # Read from stream
-            results = await self.redis_client.xread(
-                {stream_key: from_id},
-                count=1000,
-                block=0
-            )
-
-            events = []
-            for stream, messages in results:
-                for message_id, data in messages:
-                    # Reconstruct event
-                    event = Event(
-                        event_id=data['event_id'],
-                        event_type=data['event_type'],
-                        source=data['source'],
-                        destination=data['destination'] if data['destination'] else None,
-                        data=json.loads(data['data']),
-                        metadata=json.loads(data['metadata']),
-                        timestamp=datetime.fromisoformat(data['timestamp']),
-                        priority=Priority[data['priority']],
-                        correlation_id=data['correlation_id'] if data['correlation_id'] else None,
-                        parent_id=data['parent_id'] if data['parent_id'] else None
-                    )
-                    events.append(event)
-
-                    # Optionally call handler
-                    if handler:
-                        await self._safe_call_handler(handler, event)
-
-            return events
-        except Exception as e:
-            print(f"⚠ Failed to replay stream {stream_key}: {e}")
-            return []
+        start_id = _next_stream_id(from_id)
+        handler_is_coro = asyncio.iscoroutinefunction(handler)
+
+        while True:
+            try:
+                messages = await self.redis_client.xrange(
+                    stream_key,
+                    min=start_id,
+                    count=batch_size
+                )
+                if not messages:
+                    return
+
+                # Decode off the event loop (bulk replays can be large)
+                events = await asyncio.to_thread(_decode_batch, messages)
+            except Exception as e:
+                print(f"⚠ Failed to replay stream {stream_key}: {e}")
+                return
+
+            for event in events:
+                # Optionally call handler
+                if handler:
+                    await self._safe_call_handler(handler, handler_is_coro, event)
+                yield event
+
+            if len(messages) < batch_size:
+                return
+            start_id = _next_stream_id(messages[-1][0])
 
     def get_statistics(self) -> Dict[str, any]:
         """Get event bus statistics"""
@@ -260,8 +479,71 @@ class AsyncEventBus:
             'events_published': self.events_published,
             'events_delivered': self.events_delivered,
             'events_failed': self.events_failed,
-            'active_subscriptions': sum(len(h) for h in self._exact_subscriptions.values()) +
-                                   sum(len(h) for h in self._subscriptions.values()),
+            'active_subscriptions': self._active_subs,
             'dead_letter_queue_size': len(self.dead_letter_queue),
+            'persist_backlog': self._persist_queue.qsize() if self._persist_queue else 0,
             'redis_connected': self.redis_connected
         }
+
+
+def _json_default(obj):
+    """Encode datetimes for the stdlib json fallback (matches orjson output)"""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat().replace('+00:00', 'Z')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> str:
+    """
+    Serialize a stream payload to a JSON string
+
+    Uses orjson when installed; datetimes in event data are encoded natively
+    as ISO-8601 UTC, so publishers can pass datetime objects directly.
+
+    Args:
+        obj: Payload dict
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+def _next_stream_id(stream_id: str) -> str:
+    """Return the smallest stream ID strictly greater than stream_id"""
+    ms, _, seq = stream_id.partition('-')
+    return f"{ms}-{int(seq or 0) + 1}"
+
+
+def _parse_timestamp_ns(value: str) -> int:
+    """Parse a persisted timestamp (epoch ns, or ISO format from older entries)"""
+    try:
+        return int(value)
+    except ValueError:
+        ts = datetime.fromisoformat(value)
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return int(ts.timestamp() * 1e9)
+
+
+def _decode_batch(messages: List[tuple]) -> List[Event]:
+    """Reconstruct events from raw XRANGE entries"""
+    events = []
+    for message_id, data in messages:
+        events.append(Event(
+            event_id=data['event_id'],
+            event_type=data['event_type'],
+            source=data['source'],
+            destination=data['destination'] if data['destination'] else None,
+            data=_json_loads(data['data']),
+            metadata=_json_loads(data['metadata']),
+            timestamp_ns=_parse_timestamp_ns(data['timestamp']),
+            priority=Priority[data['priority']],
+            correlation_id=data['correlation_id'] if data['correlation_id'] else None,
+            parent_id=data['parent_id'] if data['parent_id'] else None
+        ))
+    return events
@@ -49,6 +49,7 @@ class HealthMonitor:
 
         # Health checks
         self.last_check: Optional[datetime] = None
+        self.latest: Optional[HealthCheck] = None  # Last system health check
         self.check_interval = config.get('health.check_interval', 30)
 
         # Auto-recovery
@@ -132,7 +133,6 @@ class HealthMonitor:
         health = HealthCheck(
             component="system",
             status=status,
-            timestamp=self.last_check,
             message=f"{healthy_count}/{total_count} modules healthy",
             metrics={
                 'modules_healthy': healthy_count,
@@ -156,6 +156,7 @@ class HealthMonitor:
             priority=Priority.LOW
         ), persist=False)
 
+        self.latest = health
         return health
 
     async def _check_all_modules(self) -> List[HealthCheck]:
@@ -197,16 +198,14 @@ class HealthMonitor:
         mem_info = self.process.memory_info()
         self.metrics.memory_usage_mb = mem_info.rss / 1024 / 1024
 
-        # Event bus stats
-        bus_stats = self.event_bus.get_statistics()
-        self.metrics.events_processed = bus_stats['events_delivered']
-        self.metrics.events_failed = bus_stats['events_failed']
+        # Event bus stats (read counters directly, no statistics dict)
+        self.metrics.events_processed = self.event_bus.events_delivered
+        self.metrics.events_failed = self.event_bus.events_failed
 
         # Module stats
-        loader_stats = self.module_loader.get_statistics()
-        self.metrics.modules_loaded = loader_stats['loaded']
-        self.metrics.modules_running = loader_stats['states'].get('running', 0)
-        self.metrics.modules_failed = loader_stats['states'].get('failed', 0)
+        self.metrics.modules_loaded = len(self.module_loader.modules)
+        self.metrics.modules_running = self.module_loader.count_in_state(ModuleState.RUNNING)
+        self.metrics.modules_failed = self.module_loader.count_in_state(ModuleState.FAILED)
 
         # Queue depth (if processor available)
         # Would need reference to priority processor
@@ -214,82 +213,87 @@ class HealthMonitor:
         self.metrics.last_health_check = self.last_check
 
     async def _check_for_issues(self) -> None:
-        """Check for issues and take action"""
+        """
+        Check for issues and take action
+
+        Everything found in one cycle is reported as a single
+        system.health_delta event instead of one event per issue.
+        """
+        alerts: List[Dict] = []
+        restarts: List[Dict] = []
+
         # Check failed modules
-        for module_name, info in self.module_loader.module_info.items():
+        for module_name, info in list(self.module_loader.module_info.items()):
             if info.state == ModuleState.FAILED and self.auto_restart and info.auto_restart:
                 # Try to restart failed module
-                await self._restart_module(module_name)
+                restarts.append(await self._restart_module(module_name))
 
         # Check resource usage
         if self.metrics.cpu_usage > 90:
-            await self._alert("High CPU usage", {
+            alerts.append(self._alert("High CPU usage", {
                 'cpu_usage': self.metrics.cpu_usage
-            })
+            }))
 
         if self.metrics.memory_usage_mb > 4000:  # 4GB threshold
-            await self._alert("High memory usage", {
+            alerts.append(self._alert("High memory usage", {
                 'memory_mb': self.metrics.memory_usage_mb
-            })
+            }))
 
-    async def _restart_module(self, module_name: str) -> None:
+        if not alerts and not restarts:
+            return
+
+        critical = bool(alerts) or any(not r['recovered'] for r in restarts)
+
+        await self.event_bus.publish(Event(
+            event_type="system.health_delta",
+            source="health_monitor",
+            data={
+                'alerts': alerts,
+                'restarts': restarts,
+                'timestamp': datetime.utcnow().isoformat()
+            },
+            priority=Priority.CRITICAL if critical else Priority.HIGH
+        ), persist=True)
+
+    async def _restart_module(self, module_name: str) -> Dict:
         """
         Attempt to restart a failed module
 
         Args:
             module_name: Name of module to restart
+
+        Returns:
+            Restart outcome for the health delta event
         """
         print(f"🔄 Auto-restarting failed module: {module_name}")
 
         try:
             # Reload module
             await self.module_loader.reload_module(module_name)
-
-            # Publish recovery event
-            await self.event_bus.publish(Event(
-                event_type="system.module_recovered",
-                source="health_monitor",
-                data={
-                    'module_name': module_name,
-                    'timestamp': datetime.utcnow().isoformat()
-                },
-                priority=Priority.HIGH
-            ), persist=True)
+            return {'module_name': module_name, 'recovered': True}
 
         except Exception as e:
             print(f"❌ Failed to restart module {module_name}: {e}")
+            return {'module_name': module_name, 'recovered': False, 'error': str(e)}
 
-            # Publish failure event
-            await self.event_bus.publish(Event(
-                event_type="system.module_restart_failed",
-                source="health_monitor",
-                data={
-                    'module_name': module_name,
-                    'error': str(e)
-                },
-                priority=Priority.CRITICAL
-            ), persist=True)
-
-    async def _alert(self, message: str, data: Dict) -> None:
+    def _alert(self, message: str, data: Dict) -> Dict:
         """
-        Send alert for critical issue
+        Build alert for critical issue
 
         Args:
             message: Alert message
             data: Alert data
-        """
-        await self.event_bus.publish(Event(
-            event_type="system.alert",
-            source="health_monitor",
-            data={
-                'message': message,
-                **data
-            },
-            priority=Priority.CRITICAL
-        ), persist=True)
 
+        Returns:
+            Alert entry for the health delta event
+        """
         print(f"⚠ ALERT: {message} - {data}")
 
+        return {
+            'message': message,
+            **data
+        }
+
     def get_metrics(self) -> SystemMetrics:
         """Get current system metrics"""
         return self.metrics
@@ -8,16 +8,41 @@ Handles dependency resolution and lifecycle management.
 import asyncio
 import importlib
 import importlib.util
+import logging
+import os
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from dataclasses import replace
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from graphlib import TopologicalSorter, CycleError
 import yaml
 
+try:
+    from watchfiles import awatch
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
 from .types import ModuleInfo, ModuleState, Event, EventType, Priority
 from .base_module import BaseModule
 
 
+log = logging.getLogger('unity_kernel.module_loader')
+
+# Directories never searched for module manifests
+_SKIP_DIRS = frozenset({'__pycache__', 'node_modules', 'venv'})
+
+# libyaml's C loader is much faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Event types used on the load/unload path, resolved and interned once
+EVT_MODULE_LOADED = sys.intern(EventType.MODULE_LOADED.value)
+EVT_MODULE_FAILED = sys.intern(EventType.MODULE_FAILED.value)
+EVT_MODULE_STOPPED = sys.intern(EventType.MODULE_STOPPED.value)
+
+
 class ModuleLoader:
     """
     Module discovery and lifecycle manager
@@ -45,14 +70,21 @@ class ModuleLoader:
         self.modules: Dict[str, BaseModule] = {}
         self.module_info: Dict[str, ModuleInfo] = {}
 
+        # Modules per state, kept in step with every state transition
+        self._state_counts: Counter = Counter()
+
         # Discovery
         self.discovery_paths: List[Path] = []
         self.discovered_modules: Dict[str, Path] = {}
 
+        # Parsed manifests: {path: (mtime_ns, info)}
+        self._manifest_cache: Dict[Path, Tuple[int, ModuleInfo]] = {}
+
         # Hot-reload
         self.watch_task: Optional[asyncio.Task] = None
         self.watching = False
-        self.module_mtimes: Dict[str, float] = {}
+        self.module_mtimes: Dict[str, int] = {}  # module.py st_mtime_ns
+        self._stop_watch_event: Optional[asyncio.Event] = None
 
     async def discover(self) -> List[str]:
         """
@@ -69,11 +101,12 @@ class ModuleLoader:
 
         for base_path in self.discovery_paths:
             if not base_path.exists():
-                print(f"⚠ Module path not found: {base_path}")
+                log.warning("⚠ Module path not found: %s", base_path)
                 continue
 
             # Find all manifest.yaml files
-            for manifest_path in base_path.rglob('manifest.yaml'):
+            for manifest_file in self._iter_manifests(base_path):
+                manifest_path = Path(manifest_file)
                 module_dir = manifest_path.parent
 
                 try:
@@ -82,29 +115,60 @@ class ModuleLoader:
 
                     # Register discovered module
                     self.discovered_modules[info.name] = module_dir
-                    self.module_info[info.name] = info
+                    self._register_info(info)
                     discovered.append(info.name)
 
                     # Track modification time for hot-reload
                     logic_file = module_dir / 'module.py'
                     if logic_file.exists():
-                        self.module_mtimes[info.name] = logic_file.stat().st_mtime
+                        self.module_mtimes[info.name] = logic_file.stat().st_mtime_ns
 
                 except Exception as e:
-                    print(f"⚠ Failed to load manifest {manifest_path}: {e}")
+                    log.warning("⚠ Failed to load manifest %s: %s", manifest_path, e)
 
-        print(f"✓ Discovered {len(discovered)} modules")
+        log.info("✓ Discovered %d modules", len(discovered))
         return discovered
 
+    @staticmethod
+    def _iter_manifests(base_path: Path) -> Iterator[str]:
+        """
+        Walk a directory tree with os.scandir and yield manifest.yaml paths
+
+        Skips hidden directories and common cache/dependency trees. Only
+        matching files are yielded, so no Path objects are built per entry.
+        """
+        stack = [str(base_path)]
+
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue  # Unreadable directory, same as rglob
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name == 'manifest.yaml':
+                        yield entry.path
+
     async def _load_manifest(self, manifest_path: Path) -> ModuleInfo:
-        """Load module info from manifest file"""
+        """Load module info from manifest file (cached until the file changes)"""
+        mtime_ns = manifest_path.stat().st_mtime_ns
+        cached = self._manifest_cache.get(manifest_path)
+        if cached and cached[0] == mtime_ns:
+            # Copy so runtime state changes don't leak into the cache
+            return replace(cached[1])
+
         with open(manifest_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
-        return ModuleInfo(
-            name=data['name'],
+        info = ModuleInfo(
+            # Interned: these are used as dict keys on every lookup/dispatch
+            name=sys.intern(data['name']),
             version=data.get('version', '1.0.0'),
-            module_type=data.get('type', 'unknown'),
+            module_type=sys.intern(data.get('type', 'unknown')),
             description=data.get('description', ''),
             author=data.get('author', ''),
             depends_on=data.get('dependencies', {}).get('modules', []),
@@ -118,22 +182,64 @@ class ModuleLoader:
             auto_restart=data.get('auto_restart', True)
         )
 
+        self._manifest_cache[manifest_path] = (mtime_ns, info)
+        return replace(info)
+
     async def load_all(self) -> None:
-        """Load all discovered modules in dependency order"""
+        """
+        Load all discovered modules in dependency order
+
+        Modules in the same dependency layer don't depend on each other,
+        so each layer is loaded concurrently.
+        """
         if not self.discovered_modules:
             await self.discover()
 
-        # Resolve load order
-        load_order = self._resolve_dependencies()
+        sorter = self._dependency_sorter()
 
-        # Load modules
-        for module_name in load_order:
-            try:
-                await self.load_module(module_name)
-            except Exception as e:
-                print(f"❌ Failed to load module {module_name}: {e}")
-                self.module_info[module_name].state = ModuleState.FAILED
-                self.module_info[module_name].error = str(e)
+        while sorter.is_active():
+            layer = self._next_layer(sorter)
+
+            results = await asyncio.gather(
+                *[self.load_module(name) for name in layer],
+                return_exceptions=True
+            )
+
+            for module_name, result in zip(layer, results):
+                if isinstance(result, Exception):
+                    log.error("❌ Failed to load module %s: %s", module_name, result)
+                    self._set_state(self.module_info[module_name], ModuleState.FAILED)
+                    self.module_info[module_name].error = str(result)
+
+            sorter.done(*layer)
+
+    async def unload_all(self) -> None:
+        """
+        Unload all loaded modules in reverse dependency order
+
+        A module is only stopped after everything that depends on it;
+        modules within the same layer are unloaded concurrently. Never fails
+        on ordering: with a dependency cycle, modules are unloaded one at a
+        time in reverse load order instead.
+        """
+        layers = []
+
+        try:
+            sorter = self._dependency_sorter()
+        except RuntimeError as e:
+            log.warning("⚠ %s; unloading in reverse load order", e)
+            layers = [[name] for name in self.modules]
+        else:
+            while sorter.is_active():
+                layer = self._next_layer(sorter)
+                layers.append(layer)
+                sorter.done(*layer)
+
+        for layer in reversed(layers):
+            loaded = [name for name in layer if name in self.modules]
+            if loaded:
+                # unload_module logs and records its own failures
+                await asyncio.gather(*[self.unload_module(name) for name in loaded])
 
     def _resolve_dependencies(self) -> List[str]:
         """
@@ -142,40 +248,37 @@ class ModuleLoader:
         Returns:
             List of module names in load order
         """
-        # Build dependency graph
-        graph: Dict[str, Set[str]] = {}
+        sorter = self._dependency_sorter()
+        result = []
 
-        for name, info in self.module_info.items():
-            # Only include dependencies that exist
-            deps = set(d for d in info.depends_on if d in self.module_info)
-            graph[name] = deps
+        while sorter.is_active():
+            layer = self._next_layer(sorter)
+            result.extend(layer)
+            sorter.done(*layer)
 
-        # Topological sort (Kahn's algorithm)
-        in_degree = {name: len(deps) for name, deps in graph.items()}
-        queue = [name for name, degree in in_degree.items() if degree == 0]
-        result = []
+        return result
 
-        while queue:
-            # Sort by priority before processing
-            queue.sort(key=lambda n: self.module_info[n].priority.value)
+    def _dependency_sorter(self) -> TopologicalSorter:
+        """Build a prepared topological sorter over discovered modules"""
+        sorter = TopologicalSorter()
 
-            node = queue.pop(0)
-            result.append(node)
+        for name, info in self.module_info.items():
+            # Only include dependencies that exist
+            sorter.add(name, *[d for d in info.depends_on if d in self.module_info])
 
-            # Reduce in-degree for dependents
-            for dependent in graph.keys():
-                if node in graph[dependent]:
-                    graph[dependent].remove(node)
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        queue.append(dependent)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise RuntimeError(f"Circular dependency detected in modules: {e.args[1]}")
 
-        # Check for circular dependencies
-        if len(result) != len(graph):
-            unresolved = set(graph.keys()) - set(result)
-            raise RuntimeError(f"Circular dependency detected in modules: {unresolved}")
+        return sorter
 
-        return result
+    def _next_layer(self, sorter: TopologicalSorter) -> List[str]:
+        """Get the next ready batch of modules, sorted by priority"""
+        return sorted(
+            sorter.get_ready(),
+            key=lambda n: (self.module_info[n].priority.value, n)
+        )
 
     async def load_module(self, module_name: str) -> BaseModule:
         """
@@ -188,7 +291,7 @@ class ModuleLoader:
             Loaded module instance
         """
         if module_name in self.modules:
-            print(f"⚠ Module already loaded: {module_name}")
+            log.warning("⚠ Module already loaded: %s", module_name)
             return self.modules[module_name]
 
         info = self.module_info.get(module_name)
@@ -198,37 +301,56 @@ class ModuleLoader:
         module_dir = self.discovered_modules[module_name]
 
         # Update state
-        info.state = ModuleState.LOADING
+        self._set_state(info, ModuleState.LOADING)
 
         try:
-            # Add module directory to Python path
-            sys.path.insert(0, str(module_dir))
-
             # Import module
             module_file = module_dir / 'module.py'
             if not module_file.exists():
                 raise FileNotFoundError(f"No module.py found in {module_dir}")
 
-            # Load Python module
-            spec = importlib.util.spec_from_file_location(
-                f"unity_modules.{module_name}",
-                module_file
-            )
-            py_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(py_module)
-
-            # Find module class (should inherit from BaseModule)
-            module_class = None
-            for item_name in dir(py_module):
-                item = getattr(py_module, item_name)
-                if (isinstance(item, type) and
-                    issubclass(item, BaseModule) and
-                    item is not BaseModule):
-                    module_class = item
-                    break
-
-            if not module_class:
-                raise ValueError(f"No BaseModule subclass found in {module_name}")
+            # Load Python module (reuse it if already imported and module.py is
+            # unchanged on disk; reload_module evicts it unconditionally)
+            modules = sys.modules
+            module_key = f"unity_modules.{module_name}"
+            mtime_ns = module_file.stat().st_mtime_ns
+            py_module = modules.get(module_key)
+
+            if py_module is not None and getattr(py_module, '__unity_mtime_ns__', None) != mtime_ns:
+                self._evict_module(module_name)
+                py_module = None
+
+            if py_module is None:
+                # Load as a package rooted at the module directory so siblings
+                # resolve via relative imports without touching sys.path
+                spec = importlib.util.spec_from_file_location(
+                    module_key,
+                    module_file,
+                    submodule_search_locations=[str(module_dir)]
+                )
+                py_module = importlib.util.module_from_spec(spec)
+                modules[module_key] = py_module
+                try:
+                    spec.loader.exec_module(py_module)
+                except BaseException:
+                    del modules[module_key]
+                    raise
+                py_module.__unity_mtime_ns__ = mtime_ns
+
+            # Find module class (should inherit from BaseModule), cached on the module
+            module_class = getattr(py_module, '__unity_module_class__', None)
+            if module_class is None:
+                for item in vars(py_module).values():
+                    if (isinstance(item, type) and
+                        item is not BaseModule and
+                        issubclass(item, BaseModule)):
+                        module_class = item
+                        break
+
+                if not module_class:
+                    raise ValueError(f"No BaseModule subclass found in {module_name}")
+
+                py_module.__unity_module_class__ = module_class
 
             # Instantiate module
             instance = module_class(info, self.config, self.event_bus)
@@ -238,12 +360,12 @@ class ModuleLoader:
 
             # Register module
             self.modules[module_name] = instance
-            info.state = ModuleState.RUNNING
+            self._set_state(info, ModuleState.RUNNING)
             info.loaded_at = datetime.utcnow()
 
             # Publish event
             await self.event_bus.publish(Event(
-                event_type=EventType.MODULE_LOADED.value,
+                event_type=EVT_MODULE_LOADED,
                 source="module_loader",
                 data={
                     'module_name': module_name,
@@ -252,16 +374,16 @@ class ModuleLoader:
                 }
             ), persist=False)
 
-            print(f"✓ Loaded module: {module_name} ({info.module_type})")
+            log.info("✓ Loaded module: %s (%s)", module_name, info.module_type)
             return instance
 
         except Exception as e:
-            info.state = ModuleState.FAILED
+            self._set_state(info, ModuleState.FAILED)
             info.error = str(e)
 
             # Publish failure event
             await self.event_bus.publish(Event(
-                event_type=EventType.MODULE_FAILED.value,
+                event_type=EVT_MODULE_FAILED,
                 source="module_loader",
                 data={
                     'module_name': module_name,
@@ -280,7 +402,7 @@ class ModuleLoader:
             module_name: Name of module to unload
         """
         if module_name not in self.modules:
-            print(f"⚠ Module not loaded: {module_name}")
+            log.warning("⚠ Module not loaded: %s", module_name)
             return
 
         module = self.modules[module_name]
@@ -292,19 +414,19 @@ class ModuleLoader:
 
             # Remove from registry
             del self.modules[module_name]
-            info.state = ModuleState.UNLOADED
+            self._set_state(info, ModuleState.UNLOADED)
 
             # Publish event
             await self.event_bus.publish(Event(
-                event_type=EventType.MODULE_STOPPED.value,
+                event_type=EVT_MODULE_STOPPED,
                 source="module_loader",
                 data={'module_name': module_name}
             ), persist=False)
 
-            print(f"✓ Unloaded module: {module_name}")
+            log.info("✓ Unloaded module: %s", module_name)
 
         except Exception as e:
-            print(f"❌ Failed to unload module {module_name}: {e}")
+            log.error("❌ Failed to unload module %s: %s", module_name, e)
             info.error = str(e)
 
     async def reload_module(self, module_name: str) -> None:
@@ -314,42 +436,59 @@ class ModuleLoader:
         Args:
             module_name: Name of module to reload
         """
-        print(f"🔄 Reloading module: {module_name}")
+        log.info("🔄 Reloading module: %s", module_name)
 
         # Unload
         if module_name in self.modules:
             await self.unload_module(module_name)
 
         # Clear import cache
-        module_key = f"unity_modules.{module_name}"
-        if module_key in sys.modules:
-            del sys.modules[module_key]
+        self._evict_module(module_name)
 
         # Reload manifest (config might have changed)
         module_dir = self.discovered_modules[module_name]
         manifest_path = module_dir / 'manifest.yaml'
         new_info = await self._load_manifest(manifest_path)
-        self.module_info[module_name] = new_info
+        self._register_info(new_info)
 
         # Load
         await self.load_module(module_name)
 
-        print(f"✓ Module reloaded: {module_name}")
+        log.info("✓ Module reloaded: %s", module_name)
+
+    @staticmethod
+    def _evict_module(module_name: str) -> None:
+        """Drop a module and any submodules it imported from sys.modules"""
+        module_key = f"unity_modules.{module_name}"
+        for key in [k for k in sys.modules if k == module_key or k.startswith(module_key + '.')]:
+            del sys.modules[key]
 
     async def start_watching(self, interval: float = 1.0) -> None:
         """
         Start watching modules for changes (hot-reload)
 
+        Uses OS-native file events (inotify/FSEvents) via watchfiles when
+        available, otherwise falls back to polling module files.
+
         Args:
-            interval: Check interval in seconds
+            interval: Check interval in seconds (polling fallback only)
         """
         self.watching = True
-        self.watch_task = asyncio.create_task(self._watch_loop(interval))
-        print(f"✓ Module hot-reload enabled (checking every {interval}s)")
+
+        force_polling = self.config.get('modules.watch_force_polling', False)
+        if WATCHFILES_AVAILABLE and not force_polling:
+            self._stop_watch_event = asyncio.Event()
+            self.watch_task = asyncio.create_task(self._watch_events())
+            log.info("✓ Module hot-reload enabled (native file events)")
+        else:
+            self.watch_task = asyncio.create_task(self._watch_loop(interval))
+            log.info("✓ Module hot-reload enabled (checking every %ss)", interval)
 
     async def stop_watching(self) -> None:
         """Stop watching modules"""
         self.watching = False
+        if self._stop_watch_event:
+            self._stop_watch_event.set()
         if self.watch_task:
             self.watch_task.cancel()
             try:
@@ -357,8 +496,42 @@ class ModuleLoader:
             except asyncio.CancelledError:
                 pass
 
+    async def _watch_events(self) -> None:
+        """Background task that reloads modules on file-system events"""
+        # awatch reports absolute paths; key on resolved dirs so relative
+        # discovery paths (e.g. "./modules") still match
+        dir_to_module = {str(Path(d).resolve()): name for name, d in self.discovered_modules.items()}
+        if not dir_to_module:
+            return
+
+        try:
+            async for changes in awatch(*dir_to_module, stop_event=self._stop_watch_event):
+                # Several events may arrive for one save; reload each module once
+                changed = []
+                for _, path in changes:
+                    changed_file = Path(path)
+                    if changed_file.name != 'module.py':
+                        continue
+
+                    module_name = dir_to_module.get(str(changed_file.parent.resolve()))
+                    info = self.module_info.get(module_name)
+
+                    # Only hot-reload if enabled
+                    if info and info.hot_reload and module_name not in changed:
+                        changed.append(module_name)
+
+                for module_name in changed:
+                    try:
+                        log.info("🔄 Detected change in %s", module_name)
+                        await self.reload_module(module_name)
+                    except Exception as e:
+                        log.warning("⚠ Module watch error: %s", e)
+
+        except asyncio.CancelledError:
+            pass
+
     async def _watch_loop(self, interval: float) -> None:
-        """Background task that watches for module changes"""
+        """Background task that polls for module changes"""
         while self.watching:
             try:
                 await asyncio.sleep(interval)
@@ -371,22 +544,23 @@ class ModuleLoader:
                     if not info or not info.hot_reload:
                         continue
 
-                    logic_file = module_dir / 'module.py'
-                    if not logic_file.exists():
+                    # Single stat() per module; a missing file is just skipped
+                    try:
+                        current_mtime = os.stat(os.path.join(module_dir, 'module.py')).st_mtime_ns
+                    except FileNotFoundError:
                         continue
 
-                    current_mtime = logic_file.stat().st_mtime
                     last_mtime = self.module_mtimes.get(module_name, 0)
 
                     if current_mtime > last_mtime:
-                        print(f"🔄 Detected change in {module_name}")
+                        log.info("🔄 Detected change in %s", module_name)
                         await self.reload_module(module_name)
                         self.module_mtimes[module_name] = current_mtime
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"⚠ Module watch error: {e}")
+                log.warning("⚠ Module watch error: %s", e)
 
     def get_loaded_modules(self) -> List[str]:
         """Get list of loaded module names"""
@@ -396,16 +570,30 @@ class ModuleLoader:
         """Get module instance by name"""
         return self.modules.get(name)
 
+    def _register_info(self, info: ModuleInfo) -> None:
+        """Add or replace a module's info, keeping state counts in step"""
+        previous = self.module_info.get(info.name)
+        if previous is not None:
+            self._state_counts[previous.state] -= 1
+
+        self.module_info[info.name] = info
+        self._state_counts[info.state] += 1
+
+    def _set_state(self, info: ModuleInfo, new_state: ModuleState) -> None:
+        """Transition a module's state, keeping state counts in step"""
+        self._state_counts[info.state] -= 1
+        info.state = new_state
+        self._state_counts[new_state] += 1
+
+    def count_in_state(self, state: ModuleState) -> int:
+        """Number of discovered modules currently in the given state"""
+        return self._state_counts[state]
+
     def get_statistics(self) -> Dict[str, any]:
         """Get loader statistics"""
-        state_counts = {}
-        for info in self.module_info.values():
-            state = info.state.value
-            state_counts[state] = state_counts.get(state, 0) + 1
-
         return {
             'discovered': len(self.discovered_modules),
             'loaded': len(self.modules),
-            'states': state_counts,
+            'states': {s.value: c for s, c in self._state_counts.items() if c},
             'hot_reload_enabled': self.watching
         }
@@ -6,12 +6,23 @@ Multiple worker pools for different priority levels.
 """
 
 import asyncio
-from asyncio import Queue, PriorityQueue
-from typing import Dict, Optional, Callable
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from asyncio import Queue
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from datetime import datetime
+import sys
 import time
 
-from .types import Event, Priority, QueueItem
+from .types import Event, EventType, Priority, QueueItem
+
+
+log = logging.getLogger('unity_kernel.priority_queue')
+
+# Event types published by workers, resolved and interned once
+EVT_TASK_COMPLETED_BATCH = sys.intern(EventType.TASK_COMPLETED_BATCH.value)
+EVT_TASK_FAILED = sys.intern(EventType.TASK_FAILED.value)
 
 
 class AsyncPriorityProcessor:
@@ -37,14 +48,10 @@ class AsyncPriorityProcessor:
         """
         self.event_bus = event_bus
 
-        # One queue per priority level
-        self.queues: Dict[Priority, PriorityQueue] = {
-            Priority.CRITICAL: PriorityQueue(),
-            Priority.HIGH: PriorityQueue(),
-            Priority.NORMAL: PriorityQueue(),
-            Priority.LOW: PriorityQueue(),
-            Priority.DEFERRED: PriorityQueue()
-        }
+        # One queue per priority level. Every item in a tier has the same
+        # priority, so a plain FIFO queue gives the right order without heap sifts.
+        # Created in start() on the running loop (Python 3.9 binds at construction).
+        self.queues: Dict[Priority, Queue] = {}
 
         # Worker configuration
         self.worker_counts = {
@@ -55,9 +62,26 @@ class AsyncPriorityProcessor:
             Priority.DEFERRED: 2
         }
 
+        # Completion events are coalesced per worker: flushed every N tasks,
+        # after this many seconds, or whenever the worker goes idle
+        self.completion_batch_size = 64
+        self.completion_flush_interval = 0.01
+
         # Worker tasks
         self.workers: Dict[Priority, list] = {p: [] for p in Priority}
 
+        # Sync handlers run here so blocking work never stalls the event loop
+        self._sync_executor = ThreadPoolExecutor(
+            max_workers=sum(self.worker_counts.values()),
+            thread_name_prefix='unity-sync'
+        )
+
+        # Delayed retries: (due monotonic time, item), drained by one scheduler
+        # task so workers never sleep through a backoff
+        self._retry_heap: List[Tuple[float, QueueItem]] = []
+        self._retry_event: Optional[asyncio.Event] = None  # Created in start()
+        self._retry_task: Optional[asyncio.Task] = None
+
         # Statistics
         self.stats = {
             'tasks_queued': 0,
@@ -73,6 +97,11 @@ class AsyncPriorityProcessor:
         """Start all worker pools"""
         self.running = True
 
+        # Loop-bound primitives are built on the running loop
+        if not self.queues:
+            self.queues = {p: Queue() for p in Priority}
+        self._retry_event = asyncio.Event()
+
         # Start workers for each priority level
         for priority, count in self.worker_counts.items():
             for i in range(count):
@@ -81,7 +110,9 @@ class AsyncPriorityProcessor:
                 )
                 self.workers[priority].append(worker)
 
-        print(f"✓ Priority processor started with {sum(self.worker_counts.values())} workers")
+        self._retry_task = asyncio.create_task(self._retry_scheduler())
+
+        log.info("✓ Priority processor started with %d workers", sum(self.worker_counts.values()))
 
     async def stop(self) -> None:
         """Stop all workers gracefully"""
@@ -96,6 +127,15 @@ class AsyncPriorityProcessor:
                 except asyncio.CancelledError:
                     pass
 
+        if self._retry_task:
+            self._retry_task.cancel()
+            try:
+                await self._retry_task
+            except asyncio.CancelledError:
+                pass
+
+        self._sync_executor.shutdown(wait=False)
+
     async def enqueue(self, item: QueueItem) -> None:
         """
         Enqueue a task for processing
@@ -103,9 +143,41 @@ class AsyncPriorityProcessor:
         Args:
             item: Queue item with event and metadata
         """
+        if not self.queues:
+            raise RuntimeError("Priority processor not started")
+
         await self.queues[item.priority].put(item)
         self.stats['tasks_queued'] += 1
 
+    async def _retry_scheduler(self) -> None:
+        """Re-enqueue retried items once their backoff delay has elapsed"""
+        heap = self._retry_heap
+
+        while self.running:
+            try:
+                if not heap:
+                    self._retry_event.clear()
+                    await self._retry_event.wait()
+                    continue
+
+                delay = heap[0][0] - time.monotonic()
+                if delay > 0:
+                    # Wake early if a sooner retry is scheduled meanwhile
+                    self._retry_event.clear()
+                    try:
+                        await asyncio.wait_for(self._retry_event.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                _, item = heapq.heappop(heap)
+                await self.enqueue(item)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log.warning("⚠ Retry scheduler error: %s", e)
+
     async def _worker(self, priority: Priority, worker_id: int) -> None:
         """
         Worker coroutine that processes tasks from its queue
@@ -115,23 +187,57 @@ class AsyncPriorityProcessor:
             worker_id: Unique ID for this worker
         """
         queue = self.queues[priority]
+        completed: List[Dict[str, Any]] = []
+        last_flush = time.monotonic()
 
         while self.running:
             try:
+                # Flush pending completions before blocking on an empty queue
+                if completed and queue.empty():
+                    await self._flush_completions(completed, priority, worker_id)
+                    completed = []
+                    last_flush = time.monotonic()
+
                 # Get next item (blocks until available)
                 item: QueueItem = await queue.get()
 
                 # Process the task
-                await self._process_item(item, priority, worker_id)
+                completion = await self._process_item(item, priority, worker_id)
+                if completion:
+                    completed.append(completion)
 
                 queue.task_done()
 
+                if completed and (
+                    len(completed) >= self.completion_batch_size or
+                    time.monotonic() - last_flush > self.completion_flush_interval
+                ):
+                    await self._flush_completions(completed, priority, worker_id)
+                    completed = []
+                    last_flush = time.monotonic()
+
             except asyncio.CancelledError:
+                if completed:
+                    await self._flush_completions(completed, priority, worker_id)
                 break
             except Exception as e:
-                print(f"⚠ Worker {priority.name}-{worker_id} error: {e}")
-
-    async def _process_item(self, item: QueueItem, priority: Priority, worker_id: int) -> None:
+                log.warning("⚠ Worker %s-%d error: %s", priority.name, worker_id, e)
+
+    async def _flush_completions(self, completed: List[Dict[str, Any]],
+                                 priority: Priority, worker_id: int) -> None:
+        """Publish one completion event for a batch of processed tasks"""
+        await self.event_bus.publish(Event(
+            event_type=EVT_TASK_COMPLETED_BATCH,
+            source="priority_processor",
+            data={
+                'priority': priority.name,
+                'worker_id': worker_id,
+                'completions': completed
+            }
+        ), persist=False)
+
+    async def _process_item(self, item: QueueItem, priority: Priority,
+                            worker_id: int) -> Optional[Dict[str, Any]]:
         """
         Process a single queue item
 
@@ -139,33 +245,32 @@ class AsyncPriorityProcessor:
             item: Item to process
             priority: Priority level
             worker_id: Worker processing this item
+
+        Returns:
+            Completion record on success, None if the task failed
         """
         start_time = time.time()
 
         try:
             # Call the handler
             if item.handler:
-                if asyncio.iscoroutinefunction(item.handler):
+                if item._is_coro:
                     await item.handler(item.event)
                 else:
-                    item.handler(item.event)
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._sync_executor, item.handler, item.event
+                    )
 
             # Success
             self.stats['tasks_completed'] += 1
 
-            # Publish completion event
-            completion_event = Event(
-                event_type="task.completed",
-                source="priority_processor",
-                data={
-                    'original_event_id': item.event.event_id,
-                    'priority': priority.name,
-                    'worker_id': worker_id,
-                    'processing_time_ms': (time.time() - start_time) * 1000
-                },
-                correlation_id=item.event.event_id
-            )
-            await self.event_bus.publish(completion_event, persist=False)
+            # Completion is published in a batch by the worker
+            completion = {
+                'original_event_id': item.event.event_id,
+                'processing_time_ms': (time.time() - start_time) * 1000
+            }
+
+            return completion
 
         except Exception as e:
             # Failure - should we retry?
@@ -176,18 +281,18 @@ class AsyncPriorityProcessor:
                 item.retries += 1
                 self.stats['tasks_retried'] += 1
 
-                # Re-queue with exponential backoff
-                await asyncio.sleep(2 ** item.retries)
-                await self.enqueue(item)
+                # Re-queue with exponential backoff (worker moves straight on)
+                heapq.heappush(self._retry_heap, (time.monotonic() + 2 ** item.retries, item))
+                self._retry_event.set()
 
-                print(f"⚠ Task retry {item.retries}/{item.max_retries}: {item.event.event_type}")
+                log.warning("⚠ Task retry %d/%d: %s", item.retries, item.max_retries, item.event.event_type)
             else:
                 # Max retries exceeded
-                print(f"❌ Task failed after {item.max_retries} retries: {item.event.event_type}: {e}")
+                log.error("❌ Task failed after %d retries: %s: %s", item.max_retries, item.event.event_type, e)
 
                 # Publish failure event
                 failure_event = Event(
-                    event_type="task.failed",
+                    event_type=EVT_TASK_FAILED,
                     source="priority_processor",
                     data={
                         'original_event_id': item.event.event_id,
@@ -0,0 +1,102 @@
+"""
+UnityKernel Async Profiler
+
+Optional per-coroutine timing for module background tasks and event handlers.
+- Wraps coroutines so every step (send/throw) is timed
+- Aggregates wall time spent on the event loop per task name
+- Disabled by default (kernel.profile_async); zero overhead when off
+"""
+
+from collections.abc import Coroutine
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+
+class TrackedCoro(Coroutine):
+    """
+    Coroutine wrapper that times each step on the event loop
+
+    Every send()/throw() adds its duration and one step to the shared
+    [total_ns, steps] counter for this coroutine's name.
+    """
+    __slots__ = ('_coro', '_stats')
+
+    def __init__(self, coro, stats: List[int]):
+        self._coro = coro
+        self._stats = stats
+
+    def send(self, value):
+        t0 = perf_counter_ns()
+        try:
+            return self._coro.send(value)
+        finally:
+            stats = self._stats
+            stats[0] += perf_counter_ns() - t0
+            stats[1] += 1
+
+    def throw(self, *args):
+        t0 = perf_counter_ns()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            stats = self._stats
+            stats[0] += perf_counter_ns() - t0
+            stats[1] += 1
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+
+class AsyncProfiler:
+    """
+    Aggregates loop time per tracked coroutine name
+
+    A single shared instance (`profiler`) is enabled by the kernel at boot,
+    reset at shutdown, and consulted by BaseModule.create_task and the
+    event bus when dispatching handlers.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats: Dict[str, List[int]] = {}  # {name: [total_ns, steps]}
+
+    def track(self, coro, name: str) -> TrackedCoro:
+        """
+        Wrap a coroutine so its loop time is attributed to name
+
+        Args:
+            coro: Coroutine to wrap
+            name: Aggregation key (e.g. "heartbeat:HeartbeatModule._heartbeat_loop")
+
+        Returns:
+            Wrapped coroutine, accepted by asyncio.create_task
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = [0, 0]
+        return TrackedCoro(coro, stats)
+
+    def reset(self) -> None:
+        """Disable profiling and clear all collected timings"""
+        self.enabled = False
+        self._stats.clear()
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-coroutine loop time, busiest first"""
+        return {
+            name: {
+                'total_ms': total_ns / 1e6,
+                'steps': steps,
+                'avg_us': total_ns / steps / 1e3 if steps else 0.0
+            }
+            for name, (total_ns, steps) in sorted(
+                self._stats.items(), key=lambda item: item[1][0], reverse=True
+            )
+        }
+
+
+# Shared instance used by modules and the kernel
+profiler = AsyncProfiler()
@@ -5,11 +5,33 @@ Enums and dataclasses that define the kernel's type system.
 These are the fundamental building blocks.
 """
 
+import asyncio
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Callable
-from datetime import datetime
-import uuid
+from typing import Any, Dict, List, Optional, Callable, Tuple
+from datetime import datetime, timezone
+import secrets
+import sys
+import time
+
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def format_timestamp_ns(ts_ns: int) -> str:
+    """
+    Format epoch nanoseconds as a UTC ISO-8601 string
+
+    Only called at serialization boundaries.
+
+    Args:
+        ts_ns: Epoch nanoseconds (time.time_ns())
+
+    Returns:
+        ISO-8601 timestamp with UTC offset
+    """
+    return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
 
 
 class SystemState(Enum):
@@ -63,6 +85,7 @@ class EventType(Enum):
     TASK_QUEUED = "task.queued"
     TASK_STARTED = "task.started"
     TASK_COMPLETED = "task.completed"
+    TASK_COMPLETED_BATCH = "task.completed_batch"
     TASK_FAILED = "task.failed"
 
     # Configuration events
@@ -73,7 +96,7 @@ class EventType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Event:
     """
     Universal event structure
@@ -81,26 +104,70 @@ class Event:
     Everything in the kernel is an event.
     Events are immutable once created.
     """
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=lambda: secrets.token_hex(16))  # 128-bit random hex
     event_type: str = ""  # From EventType or custom registry
     source: str = "kernel"
     destination: Optional[str] = None  # None = broadcast
     data: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Epoch nanoseconds (UTC)
     priority: Priority = Priority.NORMAL
     correlation_id: Optional[str] = None  # For tracking related events
     parent_id: Optional[str] = None  # For event chains
 
+    @property
+    def timestamp(self) -> datetime:
+        """Event creation time as a UTC datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
     def __post_init__(self):
-        """Ensure timestamp is set and add to metadata"""
+        """Ensure metadata is a dict (enrichment happens in enriched_metadata)"""
         if not self.metadata:
             self.metadata = {}
-        self.metadata['created_at'] = self.timestamp.isoformat()
-        self.metadata['event_id'] = self.event_id
+
+    @classmethod
+    def from_template(cls, event_type: str, source: str, data: Dict[str, Any],
+                      priority: Priority = Priority.NORMAL,
+                      timestamp_ns: Optional[int] = None) -> 'Event':
+        """
+        Build an event without the generated __init__ (hot publish loops)
+
+        Assigns every field directly; equivalent to Event(...) with the
+        remaining fields left at their defaults.
+
+        Args:
+            event_type: Event type
+            source: Publishing module
+            data: Payload (used as-is, not copied)
+            priority: Event priority
+            timestamp_ns: Creation time in epoch ns (default: now)
+
+        Returns:
+            New event
+        """
+        event = object.__new__(cls)
+        event.event_id = secrets.token_hex(16)
+        event.event_type = event_type
+        event.source = source
+        event.destination = None
+        event.data = data
+        event.metadata = {}
+        event.timestamp_ns = time.time_ns() if timestamp_ns is None else timestamp_ns
+        event.priority = priority
+        event.correlation_id = None
+        event.parent_id = None
+        return event
+
+    def enriched_metadata(self) -> Dict[str, Any]:
+        """Metadata plus creation time and ID, built only when serializing"""
+        return {
+            **self.metadata,
+            'created_at': format_timestamp_ns(self.timestamp_ns),
+            'event_id': self.event_id
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class QueueItem:
     """
     Item in the priority queue
@@ -109,20 +176,30 @@ class QueueItem:
     """
     event: Event
     priority: Priority
-    queued_at: datetime = field(default_factory=datetime.utcnow)
+    queued_at_ns: int = field(default_factory=time.time_ns)  # Epoch nanoseconds (UTC)
     retries: int = 0
     max_retries: int = 3
     handler: Optional[Callable] = None
+    _sort_key: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    _is_coro: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute heap ordering and handler kind once per item"""
+        # Priority first, then FIFO by enqueue time
+        self._sort_key = (self.priority.value, self.queued_at_ns)
+        self._is_coro = asyncio.iscoroutinefunction(self.handler)
+
+    @property
+    def queued_at(self) -> datetime:
+        """Enqueue time as a UTC datetime"""
+        return datetime.fromtimestamp(self.queued_at_ns / 1e9, tz=timezone.utc)
 
     def __lt__(self, other: 'QueueItem') -> bool:
         """Compare for priority queue (lower priority value = higher priority)"""
-        if self.priority.value != other.priority.value:
-            return self.priority.value < other.priority.value
-        # If same priority, FIFO
-        return self.queued_at < other.queued_at
+        return self._sort_key < other._sort_key
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModuleInfo:
     """
     Module metadata from manifest
@@ -163,7 +240,7 @@ class ModuleInfo:
     auto_restart: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemMetrics:
     """
     System health and performance metrics
@@ -197,15 +274,20 @@ class SystemMetrics:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HealthCheck:
     """Health check result from a module or system component"""
     component: str
     status: str  # "healthy", "degraded", "unhealthy"
     message: str = ""
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Epoch nanoseconds (UTC)
     metrics: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def timestamp(self) -> datetime:
+        """Check time as a UTC datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
     def is_healthy(self) -> bool:
         """Check if component is healthy"""
         return self.status == "healthy"
@@ -6,9 +6,14 @@ This is what users import and interact with.
 """
 
 import asyncio
+import logging
+import logging.handlers
+import queue
 import signal
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 from datetime import datetime
 
 from core import (
@@ -22,10 +27,59 @@ from core import (
     SystemState,
     SystemMetrics,
     HealthCheck,
-    Priority
+    Priority,
+    profiler
 )
 
 
+log = logging.getLogger('unity_kernel.kernel')
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted (in-process queue only)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats on the calling thread; leave that
+        # to the listener's handler instead
+        return record
+
+
+def _setup_queue_logging() -> Optional[logging.handlers.QueueListener]:
+    """
+    Route unity_kernel.* logging through a background thread
+
+    Loggers only enqueue records; message formatting and the blocking
+    stdout write happen on the listener thread, off the event loop.
+    Skipped if the application already configured logging. Undo with
+    _teardown_queue_logging.
+    """
+    kernel_logger = logging.getLogger('unity_kernel')
+    if kernel_logger.hasHandlers():
+        return None
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)  # Same stream as print()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    kernel_logger.addHandler(_DeferredQueueHandler(log_queue))
+    if kernel_logger.level == logging.NOTSET:
+        kernel_logger.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def _teardown_queue_logging(listener: logging.handlers.QueueListener) -> None:
+    """Flush and stop the listener, then detach its QueueHandler"""
+    listener.stop()
+
+    kernel_logger = logging.getLogger('unity_kernel')
+    for handler in list(kernel_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+            kernel_logger.removeHandler(handler)
+
+
 class UnityKernel:
     """
     UnityKernel - Deterministic Async Event-Driven Runtime
@@ -52,6 +106,8 @@ class UnityKernel:
         # System state
         self.state = SystemState.STOPPED
         self.boot_time: Optional[datetime] = None
+        self._boot_time_iso: Optional[str] = None  # Formatted once at boot
+        self._boot_time_monotonic: Optional[float] = None  # Uptime clock
 
         # Core components (initialized during boot)
         self.config: Optional[ConfigManager] = None
@@ -60,9 +116,21 @@ class UnityKernel:
         self.module_loader: Optional[ModuleLoader] = None
         self.health_monitor: Optional[HealthMonitor] = None
 
-        # Shutdown handling
-        self.shutdown_event = asyncio.Event()
-        self._shutdown_handlers = []
+        # Shutdown handling: run() waits on this future; signals and
+        # request_shutdown() resolve it
+        self._stop_requested: Optional[asyncio.Future] = None
+
+        # Shutdown handlers (classified once in on_shutdown)
+        self._shutdown_handlers_async: List[Callable] = []
+        self._shutdown_handlers_sync: List[Callable] = []
+
+        # get_status() result, reused for a short TTL under dashboard polling
+        self._status_cache: Optional[dict] = None
+        self._status_cache_deadline = 0.0
+        self.status_cache_ttl = 0.25
+
+        # Non-blocking logging (started in boot, stopped in shutdown)
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
 
     async def boot(self) -> None:
         """
@@ -77,45 +145,61 @@ class UnityKernel:
         6. Start health monitor
         7. Signal system ready
         """
-        print("\n" + "="*60)
-        print("🚀 UnityKernel Booting")
-        print("="*60)
+        # Formatting/I/O on a background thread
+        if self._log_listener is None:
+            self._log_listener = _setup_queue_logging()
+
+        log.info("\n" + "="*60)
+        log.info("🚀 UnityKernel Booting")
+        log.info("="*60)
 
         self.state = SystemState.INITIALIZING
         self.boot_time = datetime.utcnow()
+        self._boot_time_iso = self.boot_time.isoformat()
+        self._boot_time_monotonic = time.monotonic()
 
         try:
             # 1. Load configuration
-            print("\n[1/7] Loading configuration...")
+            log.info("\n[1/7] Loading configuration...")
             self.config = ConfigManager(self.config_path)
             await self.config.load()
 
-            # Start config hot-reload if enabled
-            if self.config.get('kernel.hot_reload_config', True):
-                await self.config.start_watching()
+            # Per-coroutine timing of module tasks (off by default)
+            profiler.enabled = self.config.get('kernel.profile_async', False)
 
             # 2. Initialize event bus
-            print("[2/7] Initializing event bus...")
+            log.info("[2/7] Initializing event bus...")
             redis_url = self.config.get('event_bus.redis_url')
             enable_streams = self.config.get('event_bus.enable_streams', True)
 
             self.event_bus = AsyncEventBus(redis_url, enable_streams)
-            await self.event_bus.start()
 
             # 3. Initialize priority processor
-            print("[3/7] Initializing priority processor...")
+            log.info("[3/7] Initializing priority processor...")
             self.processor = AsyncPriorityProcessor(self.event_bus)
-            await self.processor.start()
 
             # 4. Initialize module loader
-            print("[4/7] Initializing module loader...")
+            log.info("[4/7] Initializing module loader...")
             self.module_loader = ModuleLoader(self.config, self.event_bus)
 
-            # 5. Discover and load modules
-            print("[5/7] Discovering modules...")
-            await self.module_loader.discover()
+            # 5. Discover modules
+            log.info("[5/7] Discovering modules...")
 
-            print("[6/7] Loading modules...")
+            # Stages 2-5 only share object references, so the Redis connect,
+            # worker startup, module discovery and config watcher run concurrently
+            startup = [
+                self.event_bus.start(),
+                self.processor.start(),
+                self.module_loader.discover()
+            ]
+
+            # Start config hot-reload if enabled
+            if self.config.get('kernel.hot_reload_config', True):
+                startup.append(self.config.start_watching())
+
+            await asyncio.gather(*startup)
+
+            log.info("[6/7] Loading modules...")
             if self.config.get('modules.auto_load_core', True):
                 await self.module_loader.load_all()
 
@@ -124,7 +208,7 @@ class UnityKernel:
                 await self.module_loader.start_watching()
 
             # 6. Initialize health monitor
-            print("[7/7] Starting health monitor...")
+            log.info("[7/7] Starting health monitor...")
             self.health_monitor = HealthMonitor(
                 self.config,
                 self.event_bus,
@@ -140,25 +224,25 @@ class UnityKernel:
                 event_type=EventType.SYSTEM_READY.value,
                 source="kernel",
                 data={
-                    'boot_time': self.boot_time.isoformat(),
+                    'boot_time': self._boot_time_iso,
                     'modules_loaded': len(self.module_loader.modules),
                     'version': self.config.get('kernel.version', '0.1.0')
                 },
                 priority=Priority.HIGH
             ))
 
-            print("\n" + "="*60)
-            print("✅ UnityKernel Online")
-            print("="*60)
-            print(f"   Version: {self.config.get('kernel.version', '0.1.0')}")
-            print(f"   Modules loaded: {len(self.module_loader.modules)}")
-            print(f"   Event bus: {'Redis Streams' if self.event_bus.redis_connected else 'In-memory'}")
-            print(f"   Workers: {sum(self.processor.worker_counts.values())}")
-            print("="*60 + "\n")
+            log.info("\n" + "="*60)
+            log.info("✅ UnityKernel Online")
+            log.info("="*60)
+            log.info("   Version: %s", self.config.get('kernel.version', '0.1.0'))
+            log.info("   Modules loaded: %s", len(self.module_loader.modules))
+            log.info("   Event bus: %s", 'Redis Streams' if self.event_bus.redis_connected else 'In-memory')
+            log.info("   Workers: %s", sum(self.processor.worker_counts.values()))
+            log.info("="*60 + "\n")
 
         except Exception as e:
             self.state = SystemState.FAILED
-            print(f"\n❌ Boot failed: {e}")
+            log.error("\n❌ Boot failed: %s", e)
             raise
 
     async def shutdown(self) -> None:
@@ -175,9 +259,9 @@ class UnityKernel:
         if self.state == SystemState.STOPPED:
             return
 
-        print("\n" + "="*60)
-        print("📴 UnityKernel Shutting Down")
-        print("="*60)
+        log.info("\n" + "="*60)
+        log.info("📴 UnityKernel Shutting Down")
+        log.info("="*60)
 
         self.state = SystemState.SHUTTING_DOWN
 
@@ -186,60 +270,68 @@ class UnityKernel:
             await self.event_bus.publish(Event(
                 event_type=EventType.SYSTEM_SHUTDOWN.value,
                 source="kernel",
-                data={'timestamp': datetime.utcnow().isoformat()},
+                data={'timestamp': datetime.utcnow()},
                 priority=Priority.CRITICAL
             ))
 
         try:
-            # Run shutdown handlers
-            for handler in self._shutdown_handlers:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler()
-                    else:
-                        handler()
-                except Exception as e:
-                    print(f"⚠ Shutdown handler error: {e}")
+            # Run shutdown handlers concurrently (sync ones in worker threads)
+            results = await asyncio.gather(
+                *[handler() for handler in self._shutdown_handlers_async],
+                *[asyncio.to_thread(handler) for handler in self._shutdown_handlers_sync],
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    log.warning("⚠ Shutdown handler error: %s", result)
 
             # 1. Stop health monitor
             if self.health_monitor:
-                print("[1/5] Stopping health monitor...")
+                log.info("[1/5] Stopping health monitor...")
                 await self.health_monitor.stop()
 
             # 2. Unload all modules
             if self.module_loader:
-                print("[2/5] Unloading modules...")
-                for module_name in list(self.module_loader.modules.keys()):
-                    await self.module_loader.unload_module(module_name)
+                log.info("[2/5] Unloading modules...")
+                await self.module_loader.unload_all()
 
                 await self.module_loader.stop_watching()
 
             # 3. Stop priority processor
             if self.processor:
-                print("[3/5] Stopping priority processor...")
+                log.info("[3/5] Stopping priority processor...")
                 await self.processor.stop()
 
             # 4. Stop event bus
             if self.event_bus:
-                print("[4/5] Stopping event bus...")
+                log.info("[4/5] Stopping event bus...")
                 await self.event_bus.stop()
 
             # 5. Stop config watcher
             if self.config:
-                print("[5/5] Stopping config watcher...")
+                log.info("[5/5] Stopping config watcher...")
                 await self.config.stop_watching()
 
             self.state = SystemState.STOPPED
 
-            print("\n" + "="*60)
-            print("✅ UnityKernel Stopped")
-            print("="*60 + "\n")
+            log.info("\n" + "="*60)
+            log.info("✅ UnityKernel Stopped")
+            log.info("="*60 + "\n")
 
         except Exception as e:
-            print(f"\n❌ Shutdown error: {e}")
+            log.error("\n❌ Shutdown error: %s", e)
             self.state = SystemState.FAILED
             raise
 
+        finally:
+            # Don't leak profiling state into a later kernel in this process
+            profiler.reset()
+
+            # Flush queued log records and stop the listener thread
+            if self._log_listener:
+                _teardown_queue_logging(self._log_listener)
+                self._log_listener = None
+
     async def run(self) -> None:
         """
         Boot and run kernel until interrupted
@@ -247,26 +339,24 @@ class UnityKernel:
         This is the main entry point for running the kernel.
         Handles Ctrl+C gracefully.
         """
-        # Setup signal handlers
-        loop = asyncio.get_event_loop()
-
-        def signal_handler():
-            print("\n\nReceived interrupt signal...")
-            self.shutdown_event.set()
+        # Setup signal handlers: resolve a bare future (O(1) work, no Event)
+        loop = asyncio.get_running_loop()
+        self._stop_requested = loop.create_future()
 
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, signal_handler)
+            loop.add_signal_handler(sig, self.request_shutdown)
 
         try:
             # Boot
             await self.boot()
 
             # Run forever (or until interrupted)
-            print("Press Ctrl+C to shutdown\n")
-            await self.shutdown_event.wait()
+            log.info("Press Ctrl+C to shutdown\n")
+            await self._stop_requested
+            log.info("\n\nShutdown requested...")
 
         except KeyboardInterrupt:
-            print("\n\nKeyboard interrupt...")
+            log.info("\n\nKeyboard interrupt...")
 
         finally:
             # Shutdown
@@ -324,12 +414,26 @@ class UnityKernel:
 
         await self.module_loader.unload_module(module_name)
 
-    def get_health(self) -> Optional[HealthCheck]:
-        """Get current system health"""
+    async def get_health(self, refresh: bool = False) -> Optional[HealthCheck]:
+        """
+        Get current system health
+
+        Returns the health monitor's last periodic check when available,
+        so frequent polling does not trigger a module sweep per call.
+
+        Args:
+            refresh: Run a fresh health check instead of using the cached one
+
+        Returns:
+            System health check, or None if not booted
+        """
         if not self.health_monitor:
             return None
 
-        return asyncio.create_task(self.health_monitor.check_health())
+        if refresh or self.health_monitor.latest is None:
+            return await self.health_monitor.check_health()
+
+        return self.health_monitor.latest
 
     def get_metrics(self) -> Optional[SystemMetrics]:
         """Get current system metrics"""
@@ -339,11 +443,25 @@ class UnityKernel:
         return self.health_monitor.get_metrics()
 
     def get_status(self) -> dict:
-        """Get comprehensive kernel status"""
+        """
+        Get comprehensive kernel status
+
+        Built at most once per status_cache_ttl seconds (or when the kernel
+        state changes); each call gets its own shallow copy.
+        """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now < self._status_cache_deadline \
+                and cached['state'] == self.state.value:
+            return dict(cached)
+
         status = {
             'state': self.state.value,
-            'boot_time': self.boot_time.isoformat() if self.boot_time else None,
-            'uptime_seconds': (datetime.utcnow() - self.boot_time).total_seconds() if self.boot_time else 0
+            'boot_time': self._boot_time_iso,
+            'uptime_seconds': (
+                now - self._boot_time_monotonic
+                if self._boot_time_monotonic is not None else 0
+            )
         }
 
         if self.module_loader:
@@ -358,7 +476,23 @@ class UnityKernel:
         if self.health_monitor:
             status['health'] = self.health_monitor.get_health_summary()
 
-        return status
+        if profiler.enabled:
+            status['profile'] = profiler.get_statistics()
+
+        self._status_cache = status
+        self._status_cache_deadline = now + self.status_cache_ttl
+        return dict(status)
+
+    def request_shutdown(self) -> None:
+        """
+        Ask a kernel started with run() to shut down
+
+        Safe to call from modules, embedding code or signal handlers, and
+        more than once; does nothing if run() is not active.
+        """
+        stop_requested = self._stop_requested
+        if stop_requested is not None and not stop_requested.done():
+            stop_requested.set_result(None)
 
     def on_shutdown(self, handler: Callable) -> None:
         """
@@ -367,4 +501,7 @@ class UnityKernel:
         Args:
             handler: Function to call during shutdown
         """
-        self._shutdown_handlers.append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            self._shutdown_handlers_async.append(handler)
+        else:
+            self._shutdown_handlers_sync.append(handler)
@@ -9,10 +9,26 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add current directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Make the kernel directory importable once, for the kernel and every
+# module it loads ("from core import ..."); modules do no path setup
+KERNEL_DIR = str(Path(__file__).resolve().parent)
+if KERNEL_DIR not in sys.path:
+    sys.path.insert(0, KERNEL_DIR)
 
-from kernel import UnityKernel
+from kernel import UnityKernel  # noqa: E402 (needs KERNEL_DIR on sys.path)
+
+
+def install_event_loop() -> None:
+    """Use uvloop (libuv-based event loop) when available"""
+    if sys.platform == 'win32':
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 async def main():
@@ -25,6 +41,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop()
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
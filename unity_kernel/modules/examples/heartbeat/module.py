@@ -9,17 +9,16 @@ Demonstrates:
 """
 
 import asyncio
-from datetime import datetime
-
+import logging
 import sys
-from pathlib import Path
-
-# Add kernel to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import time
 
 from core import BaseModule, Event, Priority
 
 
+log = logging.getLogger('unity_kernel.modules.heartbeat')
+
+
 class HeartbeatModule(BaseModule):
     """
     Simple heartbeat module
@@ -32,7 +31,12 @@ class HeartbeatModule(BaseModule):
         # Get interval from config
         self.interval = self.get_config('interval', 5)
 
-        print(f"♥ Heartbeat module initialized (interval: {self.interval}s)")
+        # Ticks buffered per publish (1 = publish every tick)
+        self.batch_size = max(1, self.get_config('batch_size', 1))
+
+        self._event_type = sys.intern("heartbeat.tick")
+
+        log.info("♥ Heartbeat module initialized (interval: %ss)", self.interval)
 
     async def start(self) -> None:
         """Start the heartbeat"""
@@ -41,38 +45,49 @@ class HeartbeatModule(BaseModule):
         # Start heartbeat task
         self.create_task(self._heartbeat_loop())
 
-        print(f"♥ Heartbeat started")
+        log.info("♥ Heartbeat started")
 
     async def _heartbeat_loop(self) -> None:
         """Background task that publishes heartbeats"""
         beat_count = 0
+        buffer = []
 
         while self.running:
             try:
                 await asyncio.sleep(self.interval)
 
                 beat_count += 1
+                ts_ns = time.time_ns()
+
+                # Fresh payload per tick: the bus hands data to handlers by
+                # reference. Raw epoch ns; ISO formatting is left to consumers
+                buffer.append(Event.from_template(self._event_type, self.info.name, {
+                    'beat_number': beat_count,
+                    'timestamp_ns': ts_ns,
+                    'interval': self.interval
+                }, Priority.LOW, ts_ns))
 
-                # Publish heartbeat event
-                await self.publish(Event(
-                    event_type="heartbeat.tick",
-                    source=self.info.name,
-                    data={
-                        'beat_number': beat_count,
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'interval': self.interval
-                    },
-                    priority=Priority.LOW
-                ))
+                # Publish buffered heartbeats in one pipelined batch; ticks
+                # consumed in-process skip the Redis Stream round-trip
+                if len(buffer) >= self.batch_size:
+                    await self.publish_many(buffer, persist_local=False)
+                    buffer = []
 
-                print(f"♥ Heartbeat #{beat_count}")
+                log.info("♥ Heartbeat #%d", beat_count)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"⚠ Heartbeat error: {e}")
+                log.warning("⚠ Heartbeat error: %s", e)
+
+        # Publish ticks still buffered when stopped or cancelled
+        if buffer:
+            try:
+                await self.publish_many(buffer, persist_local=False)
+            except Exception as e:
+                log.warning("⚠ Heartbeat flush error: %s", e)
 
     async def stop(self) -> None:
         """Stop the heartbeat"""
-        print(f"♥ Heartbeat stopping...")
+        log.info("♥ Heartbeat stopping...")
         await super().stop()
@@ -7,15 +7,14 @@ Demonstrates:
 - Module dependencies
 """
 
-import sys
-from pathlib import Path
-
-# Add kernel to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import logging
 
 from core import BaseModule, Event
 
 
+log = logging.getLogger('unity_kernel.modules.monitor')
+
+
 class MonitorModule(BaseModule):
     """
     Monitor module
@@ -32,7 +31,7 @@ class MonitorModule(BaseModule):
         # Track heartbeat count
         self.heartbeat_count = 0
 
-        print(f"📊 Monitor module initialized")
+        log.info("📊 Monitor module initialized")
 
     async def on_heartbeat(self, event: Event) -> None:
         """
@@ -44,11 +43,10 @@ class MonitorModule(BaseModule):
         self.heartbeat_count += 1
 
         beat_number = event.data.get('beat_number', 0)
-        timestamp = event.data.get('timestamp', 'unknown')
 
-        print(f"📊 Monitor received heartbeat #{beat_number} (total: {self.heartbeat_count})")
+        log.info("📊 Monitor received heartbeat #%s (total: %s)", beat_number, self.heartbeat_count)
 
     async def stop(self) -> None:
         """Stop the monitor"""
-        print(f"📊 Monitor stopping (received {self.heartbeat_count} heartbeats total)")
+        log.info("📊 Monitor stopping (received %s heartbeats total)", self.heartbeat_count)
         await super().stop()
@@ -0,0 +1,60 @@
+"""
+Pytest Configuration for UnityKernel Tests
+
+Fixtures and setup for testing the kernel.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add kernel to path
+KERNEL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(KERNEL_ROOT))
+
+
+MANIFEST = """\
+name: "{name}"
+version: "1.0.0"
+type: "core"
+dependencies:
+  modules: {depends_on}
+"""
+
+MODULE = """\
+from core import BaseModule
+
+
+class {cls}(BaseModule):
+    async def initialize(self) -> None:
+        pass
+"""
+
+
+@pytest.fixture
+def make_kernel_config(tmp_path):
+    """Write a kernel config whose module path holds the given modules"""
+    def _make(modules):
+        modules_dir = tmp_path / "modules"
+        for name, depends_on in modules.items():
+            module_dir = modules_dir / name
+            module_dir.mkdir(parents=True)
+            (module_dir / "manifest.yaml").write_text(
+                MANIFEST.format(name=name, depends_on=depends_on)
+            )
+            (module_dir / "module.py").write_text(
+                MODULE.format(cls=name.capitalize() + "Module")
+            )
+
+        config_path = tmp_path / "system.yaml"
+        config_path.write_text(
+            "kernel:\n"
+            "  hot_reload_config: false\n"
+            "modules:\n"
+            f"  discovery_paths: [\"{modules_dir}\"]\n"
+            "  hot_reload: false\n"
+        )
+        return str(config_path)
+
+    return _make
@@ -0,0 +1,53 @@
+"""
+UnityKernel runtime tests
+"""
+
+import pytest
+
+from core import SystemState
+from kernel import UnityKernel
+
+
+async def test_shutdown_completes_with_dependency_cycle(make_kernel_config):
+    """A dependency cycle must not stop shutdown from reaching the bus/processor"""
+    kernel = UnityKernel(make_kernel_config({'alpha': ['beta'], 'beta': ['alpha']}))
+
+    with pytest.raises(RuntimeError, match="Circular dependency"):
+        await kernel.boot()
+
+    await kernel.shutdown()
+
+    assert kernel.state == SystemState.STOPPED
+    assert not kernel.processor.running
+    assert not kernel.event_bus.running
+
+
+async def test_unload_all_with_cycle_unloads_loaded_modules(make_kernel_config):
+    """Modules loaded before a cycle appears are still unloaded"""
+    kernel = UnityKernel(make_kernel_config({'alpha': [], 'beta': []}))
+    await kernel.boot()
+
+    # Introduce a cycle after both modules are loaded
+    kernel.module_loader.module_info['alpha'].depends_on = ['beta']
+    kernel.module_loader.module_info['beta'].depends_on = ['alpha']
+
+    await kernel.shutdown()
+
+    assert kernel.state == SystemState.STOPPED
+    assert kernel.module_loader.modules == {}
+
+
+async def test_get_status_returns_independent_copies(make_kernel_config):
+    """Mutating one get_status() result doesn't leak into the cached status"""
+    kernel = UnityKernel(make_kernel_config({'alpha': []}))
+    await kernel.boot()
+
+    try:
+        first = kernel.get_status()
+        first['state'] = 'tampered'
+        second = kernel.get_status()
+
+        assert second is not first
+        assert second['state'] == SystemState.RUNNING.value
+    finally:
+        await kernel.shutdown()
@@ -0,0 +1,29 @@
+"""
+Module loader tests
+"""
+
+import os
+import sys
+
+from kernel import UnityKernel
+
+
+async def test_load_after_unload_picks_up_edits(make_kernel_config, tmp_path):
+    """unload_module + load_module runs the code currently on disk"""
+    kernel = UnityKernel(make_kernel_config({'alpha': []}))
+    await kernel.boot()
+
+    try:
+        loader = kernel.module_loader
+        await loader.unload_module('alpha')
+
+        module_file = tmp_path / "modules" / "alpha" / "module.py"
+        module_file.write_text(module_file.read_text() + "\n\nVERSION = 2\n")
+        stat = module_file.stat()
+        os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        module = await loader.load_module('alpha')
+
+        assert getattr(sys.modules[type(module).__module__], 'VERSION', None) == 2
+    finally:
+        await kernel.shutdown()
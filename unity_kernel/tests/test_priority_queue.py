@@ -0,0 +1,35 @@
+"""
+Priority processor tests
+"""
+
+import asyncio
+
+from core import AsyncEventBus, AsyncPriorityProcessor, Event, Priority, QueueItem
+
+
+def test_components_built_before_the_event_loop():
+    """Bus and processor may be constructed before asyncio.run() (3.9 loop binding)"""
+    bus = AsyncEventBus(enable_streams=False)
+    processor = AsyncPriorityProcessor(bus)
+    handled = []
+
+    async def handler(event: Event) -> None:
+        handled.append(event)
+
+    async def main():
+        await bus.start()
+        await processor.start()
+        try:
+            await processor.enqueue(QueueItem(Event(event_type="test.run"), Priority.HIGH,
+                                              handler=handler))
+            for _ in range(100):
+                if handled:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await processor.stop()
+            await bus.stop()
+
+    asyncio.run(main())
+
+    assert len(handled) == 1
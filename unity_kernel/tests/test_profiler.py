@@ -0,0 +1,49 @@
+"""
+Async profiler tests
+"""
+
+import asyncio
+
+from core import AsyncEventBus, Event, profiler
+from kernel import UnityKernel
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    async def on_event(self, event: Event) -> None:
+        self.events.append(event)
+
+
+async def test_bus_handlers_are_profiled():
+    """Handler time is attributed to the handler's qualified name"""
+    bus = AsyncEventBus(enable_streams=False)
+    await bus.start()
+    recorder = Recorder()
+    bus.subscribe("sensor.*", recorder.on_event)
+
+    profiler.enabled = True
+    try:
+        await bus.publish(Event(event_type="sensor.camera"))
+        await asyncio.sleep(0)
+
+        stats = profiler.get_statistics()
+        assert recorder.events
+        assert stats['Recorder.on_event']['steps'] >= 1
+    finally:
+        profiler.reset()
+        await bus.stop()
+
+
+async def test_shutdown_resets_profiler(make_kernel_config):
+    """A later kernel in the same process starts with a clean profiler"""
+    kernel = UnityKernel(make_kernel_config({'alpha': []}))
+    await kernel.boot()
+    profiler.enabled = True
+    profiler.track(asyncio.sleep(0), 'stale').close()
+
+    await kernel.shutdown()
+
+    assert not profiler.enabled
+    assert profiler.get_statistics() == {}